@@ -2,29 +2,23 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
-from dataclasses import dataclass, field
 import functools
 import threading
-from typing import Callable, Type
+from typing import Callable, NamedTuple, Type
 from weakref import WeakSet
 
 import pygame
 
 
-@dataclass
-class _CallableSets:
+class _CallableSets(NamedTuple):
     """
     A collection of callables, broken up by type
     """
 
-    concurrent_functions: list[Callable] = field(default_factory=list)
-    sequential_functions: list[Callable] = field(default_factory=list)
-    concurrent_methods: list[tuple[Callable, Type[object]]] = field(
-        default_factory=list
-    )
-    sequential_methods: list[tuple[Callable, Type[object]]] = field(
-        default_factory=list
-    )
+    concurrent_functions: list[Callable]
+    sequential_functions: list[Callable]
+    concurrent_methods: list[tuple[Callable, Type[object]]]
+    sequential_methods: list[tuple[Callable, Type[object]]]
 
 
 class _BaseThreadSystem(ABC):
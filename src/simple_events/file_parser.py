@@ -1,15 +1,27 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import defaultdict
 import json
 import pathlib
-from typing import TextIO, Type
+import sys
+from typing import Any, Callable, TextIO, Type
 
 from .key_map import KeyMap, KeyBind
 from .joy_map import JoyMap
 
 import pygame
 
+# orjson only speeds up loading. Saving stays on the stdlib so output remains
+# ASCII-escaped and identical across installs.
+_loads: Callable[[str], Any]
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 
 def _get_parser_from_path(path: pathlib.Path) -> Type[FileParser]:
     file_type = path.suffix
@@ -54,11 +66,10 @@ class JSONParser(FileParser):
         :param in_file: Target file with the required data.
         :return: Created KeyMap and JoyMap
         """
-        maps: dict = json.load(in_file)
+        maps: dict = _loads(in_file.read())
         key_map = KeyMap()
         key_map.key_binds = JSONParser._unpack_keys(maps.get("keys", {}))
-        joy_map = JoyMap()
-        joy_map._joy_binds = JSONParser._unpack_joystick(maps.get("controller", {}))
+        joy_map = JoyMap(JSONParser._unpack_joystick(maps.get("controller", {})))
         return key_map, joy_map
 
     @staticmethod
@@ -72,7 +83,7 @@ class JSONParser(FileParser):
         bind_keys = key_map.pack_binds()
         bind_joysticks = joy_map.pack_binds()
         maps = {"keys": bind_keys, "controller": bind_joysticks}
-        json.dump(maps, out_file, indent=2)
+        out_file.write(json.dumps(maps, indent=2))
 
     @staticmethod
     def _unpack_keys(maps: dict) -> dict:
@@ -82,16 +93,19 @@ class JSONParser(FileParser):
         :param maps: JSON-style dictionary of keybinds
         :return: Dictionary compatible with KeyMap
         """
-        unpacked_dict: dict[int | None, list[KeyBind]] = {}
+        unpacked_dict: defaultdict[int | None, list[KeyBind]] = defaultdict(list)
+        # Local name skips the attribute lookups on each pass of the loop
+        key_code_from_name = pygame.key.key_code
         for bind_name, key_data in maps.items():
             key_name, mod = key_data
             key_code = None
             if key_name is not None:
-                key_code = pygame.key.key_code(key_name)
-            unpacked_dict.setdefault(key_code, []).append(KeyBind(bind_name, mod))
+                key_code = key_code_from_name(key_name)
+            unpacked_dict[key_code].append(KeyBind(sys.intern(bind_name), mod))
             # binds = [KeyBind(bind_name=bind[0], mod=bind[1]) for bind in bind_list]
             # unpacked_dict.update({key_code: binds})
-        return unpacked_dict
+        # Don't want KeyMap lookups creating empty entries
+        return dict(unpacked_dict)
 
     @staticmethod
     def _unpack_joystick(maps: dict) -> dict:
@@ -101,12 +115,10 @@ class JSONParser(FileParser):
         :param maps: JSON-style dictionary of joystick binds
         :return: Dictionary compatible with JoyMap
         """
-        unpacked_dict: dict[tuple, list[str]] = {}
+        unpacked_dict: defaultdict[tuple, list[str]] = defaultdict(list)
         for bind_name, joy_data in maps.items():
-            joy_data_points: list[tuple] = []
-            for data_point in joy_data:
-                joy_data_points.append((data_point[0], data_point[1]))
-            fixed_joy_data: tuple = tuple(joy_data_points)
-            unpacked_dict.setdefault(fixed_joy_data, []).append(bind_name)
+            # JSON gives us lists of [key, value] pairs, which can't be hashed.
+            fixed_joy_data: tuple = tuple(map(tuple, joy_data))
+            unpacked_dict[fixed_joy_data].append(sys.intern(bind_name))
 
-        return unpacked_dict
+        return dict(unpacked_dict)
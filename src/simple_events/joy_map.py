@@ -9,16 +9,25 @@ import pygame
 # 'value' is a read out value, and typically analog, so we don't want that captured
 # 'instance_id" is the specific joystick instace, we want to call regardless of that
 # 'joy' is deprecated and can safely be ignored
-_invalid_params = ["value", "instance_id", "joy"]
+_INVALID_PARAMS = frozenset(("value", "instance_id", "joy"))
 
 
-@dataclass
+@dataclass(slots=True)
 class JoyMap:
     """
     Gets a bind name from joystick event parameters
     """
 
     _joy_binds: dict[tuple[tuple] | None, list[str]] = field(default_factory=dict)
+    # Inversion of _joy_binds. Bind name as key, joystick data as value
+    _bind_to_key: dict[str, tuple[tuple] | None] = field(
+        default_factory=dict, init=False
+    )
+
+    def __post_init__(self) -> None:
+        for joy_data, bind_list in self._joy_binds.items():
+            for bind in bind_list:
+                self._bind_to_key[bind] = joy_data
 
     @overload
     def _convert_event(self, event: dict) -> tuple[tuple]: ...
@@ -44,16 +53,17 @@ class JoyMap:
             event_dict = event
         else:
             raise ValueError("Invalid argument type")
-        pairs: list[tuple] = []
-        for key, value in event_dict.items():
-            if key in _invalid_params:
-                continue
-            pairs.append((key, value))
         # This is a valid conversion, but Mypy doesn't like it
-        return tuple(pairs)  # type: ignore
+        return tuple(  # type: ignore
+            [
+                (key, value)
+                for key, value in event_dict.items()
+                if key not in _INVALID_PARAMS
+            ]
+        )
 
     def _convert_pairs(self, event_key: tuple[tuple]) -> dict:
-        return dict((key, value) for key, value in event_key)
+        return dict(event_key)
 
     def get(self, event: pygame.Event, default: Optional[list] = None) -> list[str]:
         """
@@ -79,34 +89,53 @@ class JoyMap:
         :raises ValueError: If bind_name is not found
         :return: dict containing joystick event data, or None if unbound
         """
-        for key, bind_list in self._joy_binds.items():
-            if bind_name in bind_list:
-                if key is None:
-                    return key
-                return self._convert_pairs(key)
-        raise ValueError(f"Bind name: {bind_name} not found.")
+        try:
+            key = self._bind_to_key[bind_name]
+        except KeyError:
+            raise ValueError(f"Bind name: {bind_name} not found.") from None
+        if key is None:
+            return key
+        return self._convert_pairs(key)
 
     def generate_bind(
         self, bind_name: str, default_joystick_data: Optional[dict] = None
     ) -> None:
-        try:
-            self.get_bound_joystick_event(bind_name)
-        except ValueError:
-            self._joy_binds.setdefault(
-                # adds the bind to joy_binds, under the given parameters
-                (
-                    self._convert_event(default_joystick_data)
-                    if default_joystick_data is not None
-                    else None
-                ),
-                [],
-            ).append(bind_name)
+        if bind_name in self._bind_to_key:
+            # Don't overwrite an existing bind
+            return
+        # adds the bind to joy_binds, under the given parameters
+        key = (
+            self._convert_event(default_joystick_data)
+            if default_joystick_data is not None
+            else None
+        )
+        self._add_to_joy_binds(key, bind_name)
 
     def _rebind(
         self, bind_name: str, new_joystick_data: Optional[tuple[tuple]] = None
     ) -> None:
+        if self._is_bound_to(bind_name, new_joystick_data):
+            return
         self.remove_bind(bind_name)
-        self._joy_binds.setdefault(new_joystick_data, []).append(bind_name)
+        self._add_to_joy_binds(new_joystick_data, bind_name)
+
+    def _add_to_joy_binds(self, key: tuple[tuple] | None, bind_name: str) -> None:
+        # Avoids setdefault, which builds a throwaway list when the key exists
+        bind_list = self._joy_binds.get(key)
+        if bind_list is None:
+            self._joy_binds[key] = [bind_name]
+        else:
+            bind_list.append(bind_name)
+        self._bind_to_key[bind_name] = key
+
+    def _is_bound_to(
+        self, bind_name: str, joystick_data: Optional[tuple[tuple]]
+    ) -> bool:
+        # Can't just use .get(), None is a valid key for unbound binds
+        return (
+            bind_name in self._bind_to_key
+            and self._bind_to_key[bind_name] == joystick_data
+        )
 
     def rebind(self, bind_name: str, new_joystick_data: Optional[dict] = None):
         """
@@ -131,13 +160,13 @@ class JoyMap:
 
         :param bind_name: Name of the target bind
         """
-        dead_keys = []
-        for key, bind_list in self._joy_binds.items():
-            if bind_name in bind_list:
-                bind_list.remove(bind_name)
-            if len(bind_list) == 0:
-                dead_keys.append(key)
-        for key in dead_keys:
+        try:
+            key = self._bind_to_key.pop(bind_name)
+        except KeyError:
+            return
+        bind_list = self._joy_binds[key]
+        bind_list.remove(bind_name)
+        if not bind_list:
             self._joy_binds.pop(key)
 
     def merge(self, other: JoyMap) -> None:
@@ -148,17 +177,26 @@ class JoyMap:
         :param other: A JoyMap with preferred binds.
         """
         for joy_data, bind_list in other._joy_binds.items():
-            for bind in bind_list:
-                self._rebind(bind, joy_data)
+            moved_binds = [
+                bind for bind in bind_list if not self._is_bound_to(bind, joy_data)
+            ]
+            if not moved_binds:
+                continue
+            for bind in moved_binds:
+                self.remove_bind(bind)
+            # Move the whole list over at once instead of one _rebind per bind
+            own_binds = self._joy_binds.get(joy_data)
+            if own_binds is None:
+                self._joy_binds[joy_data] = moved_binds
+            else:
+                own_binds.extend(moved_binds)
+            for bind in moved_binds:
+                self._bind_to_key[bind] = joy_data
 
     def pack_binds(self) -> dict:
         """
         Converts the dictionary of binds and their needed inputs into a saveable dict,
         with the bind name forward for manual remapping in a file
         """
-        packed_dict: dict[str, tuple[tuple] | None] = {}
-        for joy_data, bind_list in self._joy_binds.items():
-            for bind in bind_list:
-                packed_dict.update({bind: joy_data})
-
-        return packed_dict
+        # Our bind index is already laid out this way
+        return dict(self._bind_to_key)
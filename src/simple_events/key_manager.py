@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import itertools
+from collections import defaultdict
 import logging
 from os import PathLike
 from pathlib import Path
-from typing import Any, Callable, Optional, overload, Type
+import sys
+from typing import Callable, Iterable, Optional, overload, Type
 
 # import file_parser
 from .file_parser import FileParser, _get_parser_from_path
@@ -16,9 +17,38 @@ import pygame
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+_KEYDOWN: int = pygame.KEYDOWN
+_JOYBUTTONDOWN: int = pygame.JOYBUTTONDOWN
+_JOYAXIS: int = pygame.JOYAXISMOTION
+_JOYHAT: int = pygame.JOYHATMOTION
+
+# Events that are looked up in the JoyMap
+_JOY_EVENTS: frozenset[int] = frozenset(
+    (
+        pygame.JOYAXISMOTION,
+        pygame.JOYBALLMOTION,
+        pygame.JOYBUTTONDOWN,
+        pygame.JOYBUTTONUP,
+        pygame.JOYHATMOTION,
+        pygame.JOYDEVICEADDED,
+        pygame.JOYDEVICEREMOVED,
+        pygame.CONTROLLERAXISMOTION,
+        pygame.CONTROLLERBUTTONDOWN,
+        pygame.CONTROLLERBUTTONUP,
+        pygame.CONTROLLERDEVICEADDED,
+        pygame.CONTROLLERDEVICEREMOVED,
+        pygame.CONTROLLERDEVICEREMAPPED,
+    )
+)
+
+# Shared result for events nobody listens to. Must not be modified.
+_EMPTY_SETS = _CallableSets([], [], [], [])
+
 
 class KeyListener(BaseManager):
     _listeners: dict[str, KeyListener] = {}
+    # Snapshot of _listeners' values, for fast iteration when notifying
+    _listeners_cached: tuple[KeyListener, ...] = ()
     key_map: KeyMap = KeyMap()
     joy_map: JoyMap = JoyMap()
 
@@ -27,13 +57,28 @@ class KeyListener(BaseManager):
 
         # --------Basic function assignment--------
         self._key_hooks: dict[tuple[str, bool, int], list[Callable]] = {}
+        # Inversion of _key_hooks. Function as key, _key_hooks keys as values
+        self._func_binds: defaultdict[Callable, list[tuple[str, bool, int]]] = (
+            defaultdict(list)
+        )
 
         # --------Class method assignment--------
         self._class_listeners: dict[
             tuple[str, bool, int], list[tuple[Callable, Type[object]]]
         ] = {}
-        # Inversion of _class_listeners. Method as key, bind name
-        self._class_listener_binds: dict[Callable, list[str]] = {}
+        # Inversion of _class_listeners. Method as key, _class_listeners keys as values
+        self._class_listener_binds: defaultdict[
+            Callable, list[tuple[str, bool, int]]
+        ] = defaultdict(list)
+
+        # --------Dispatch index--------
+        # Bind name and event type as key, concurrent functions, sequential functions,
+        # concurrent methods and sequential methods as values.
+        # Shares its lists with _key_hooks and _class_listeners, so they must only be
+        # modified in place.
+        self._dispatch: dict[tuple[str, int], tuple[list, list, list, list]] = {}
+        # Event types with an entry in the dispatch index
+        self._active_event_types: set[int] = set()
 
     @overload
     def bind(
@@ -128,44 +173,61 @@ class KeyListener(BaseManager):
         """
 
     def bind(self, key_bind_name: str, *args, **kwds) -> Callable:
-        event_type: int
-        is_stick = False
-        default_key: Optional[int] = kwds.get("default_key", None)
-        default_mod: Optional[int] = kwds.get("default_mod", None)
+        # Bind names are used as dict keys on every notify, interned strings can
+        # be compared by identity.
+        key_bind_name = sys.intern(key_bind_name)
+        event_type: Optional[int] = kwds.get("event_type", None)
         default_joystick_data: Optional[dict] = kwds.get("default_joystick_data", None)
-        for index, arg in enumerate(args):
-            if type(arg) is dict:
-                is_stick = True
-                default_joystick_data = arg
-                break
-            if index == 0:
-                default_key = arg
-            elif index == 1:
-                default_mod = arg
-
-        if is_stick:
-            self.joy_map.generate_bind(key_bind_name, default_joystick_data)
+        if default_joystick_data is None and args and type(args[0]) is dict:
+            default_joystick_data = args[0]
+        if default_joystick_data is not None:
+            return self._bind_joystick(key_bind_name, default_joystick_data, event_type)
+
+        default_key: Optional[int] = args[0] if args else kwds.get("default_key", None)
+        default_mod: Optional[int] = (
+            args[1] if len(args) > 1 else kwds.get("default_mod", None)
+        )
+        return self._bind_key(key_bind_name, default_key, default_mod, event_type)
+
+    def _bind_key(
+        self,
+        key_bind_name: str,
+        default_key: Optional[int] = None,
+        default_mod: Optional[int] = None,
+        event_type: Optional[int] = None,
+    ) -> Callable:
+        self.key_map.generate_bind(key_bind_name, default_key, default_mod)
+        if event_type is None:
+            event_type = _KEYDOWN
+        return self._bind_decorator(key_bind_name, event_type)
+
+    def _bind_joystick(
+        self,
+        key_bind_name: str,
+        default_joystick_data: dict,
+        event_type: Optional[int] = None,
+    ) -> Callable:
+        self.joy_map.generate_bind(key_bind_name, default_joystick_data)
+        if event_type is None:
             # Attempt to intuit the desired event from the provided dict
-            default_stick_event = pygame.JOYBUTTONDOWN
-            if default_joystick_data is not None:
-                joy_keys = default_joystick_data.keys()
-                if "axis" in joy_keys:
-                    default_stick_event = pygame.JOYAXISMOTION
-                elif "hat" in joy_keys:
-                    default_stick_event = pygame.JOYHATMOTION
-            event_type = kwds.get("event_type", default_stick_event)
-        else:
-            self.key_map.generate_bind(key_bind_name, default_key, default_mod)
-            event_type = kwds.get("event_type", pygame.KEYDOWN)
+            event_type = _JOYBUTTONDOWN
+            if "axis" in default_joystick_data:
+                event_type = _JOYAXIS
+            elif "hat" in default_joystick_data:
+                event_type = _JOYHAT
+        return self._bind_decorator(key_bind_name, event_type)
+
+    def _bind_decorator(self, key_bind_name: str, event_type: int) -> Callable:
 
         def decorator(responder: Callable) -> Callable:
             # Regardless, add the responder to the bind within our hook dict
             is_concurrent = not hasattr(responder, "_runs_sequential")
-            event_list = self._key_hooks.setdefault(
-                (key_bind_name, is_concurrent, event_type), []
-            )
-            if responder not in event_list:
-                event_list.append(responder)
+            hook_key = (key_bind_name, is_concurrent, event_type)
+            # A function has far fewer binds than a bind may have functions, so check
+            # the reverse index instead of the hook's list
+            if hook_key not in self._func_binds.get(responder, ()):
+                self._get_listeners(hook_key, False).append(responder)
+                self._func_binds[responder].append(hook_key)
             return responder
 
         return decorator
@@ -210,20 +272,13 @@ class KeyListener(BaseManager):
         *args,
         **kwds,
     ) -> dict | tuple[int | None, int | None] | None:
-        new_bind: Any
-        if len(args):
-            new_bind = args[0]
-        elif new_bind := kwds.get("new_key"):
-            pass
-        if kwds.get("new_joystick_data") or isinstance(new_bind, dict):
+        if "new_joystick_data" in kwds:
+            return self._rebind_joystick(key_bind_name, kwds["new_joystick_data"])
+        new_bind: int | dict | None = args[0] if args else kwds.get("new_key", None)
+        if isinstance(new_bind, dict):
             return self._rebind_joystick(key_bind_name, new_bind)
-        else:
-            mod_keys: int | None
-            if len(args) > 1:
-                mod_keys = args[1]
-            else:
-                mod_keys = kwds.get("new_mod", None)
-            return self._rebind_key(key_bind_name, new_bind, mod_keys)
+        mod_keys: int | None = args[1] if len(args) > 1 else kwds.get("new_mod", None)
+        return self._rebind_key(key_bind_name, new_bind, mod_keys)
 
     def _rebind_key(
         self,
@@ -275,12 +330,19 @@ class KeyListener(BaseManager):
         :param bind_name: The bind to be removed from, or all instances, if
         None. Defaults to None.
         """
-        # Greatly simplified
-        for (name, _, _), call_list in self._key_hooks.items():
-            if bind_name is not None and name != bind_name:
+        hook_keys = self._func_binds.pop(func, [])
+        remaining_keys: list[tuple[str, bool, int]] = []
+        for hook_key in hook_keys:
+            if bind_name is not None and hook_key[0] != bind_name:
+                remaining_keys.append(hook_key)
                 continue
-            if func in call_list:
-                call_list.remove(func)
+            try:
+                self._key_hooks[hook_key].remove(func)
+            except (KeyError, ValueError):
+                # Hook was already cleared
+                pass
+        if remaining_keys:
+            self._func_binds[func] = remaining_keys
 
     def _capture_method(
         self, cls: Type[object], method: Callable, tag_data: tuple
@@ -294,7 +356,7 @@ class KeyListener(BaseManager):
         :param tag_data: A tuple containing pertinent registration data
         """
         is_concurrent = not hasattr(method, "_runs_sequential")
-        key_bind_name: str = tag_data[0]
+        key_bind_name: str = sys.intern(tag_data[0])
         default_key: int = tag_data[1]
         default_mod: int = tag_data[2]
         event_type: int = tag_data[3]
@@ -306,18 +368,42 @@ class KeyListener(BaseManager):
             self.key_map.generate_bind(key_bind_name, default_key, default_mod)
 
         # -----Add to Class Listeners-----
-        listeners = self._class_listeners.setdefault(
-            (key_bind_name, is_concurrent, event_type), []
-        )
+        hook_key = (key_bind_name, is_concurrent, event_type)
+        listeners = self._get_listeners(hook_key, True)
         listeners.append((method, cls))
 
         # -----Add to Class Listener Events-----
 
-        self._class_listener_binds.setdefault(method, []).append(key_bind_name)
+        self._class_listener_binds[method].append(hook_key)
 
         # -----Add to Assigned Classes-----
         self._assigned_classes.setdefault(cls, []).append(method)
 
+    def _get_listeners(self, key: tuple[str, bool, int], is_method: bool) -> list:
+        """
+        Gets the list of functions or methods for the given bind, concurrency, and
+        event type, creating it and its place in the dispatch index if needed.
+
+        :param key: Tuple of bind name, concurrency, and event type
+        :param is_method: Whether the list holds class methods or functions
+        :return: The list of listeners for the key
+        """
+        hooks: dict[tuple[str, bool, int], list] = (
+            self._class_listeners if is_method else self._key_hooks
+        )
+        listeners = hooks.get(key)
+        if listeners is None:
+            bind_name, is_concurrent, event_type = key
+            hook_lists = self._dispatch.get((bind_name, event_type))
+            if hook_lists is None:
+                hook_lists = ([], [], [], [])
+                self._dispatch[(bind_name, event_type)] = hook_lists
+                self._active_event_types.add(event_type)
+            index = (2 if is_method else 0) + (0 if is_concurrent else 1)
+            listeners = hook_lists[index]
+            hooks[key] = listeners
+        return listeners
+
     def bind_method(
         self,
         key_bind_name: str,
@@ -369,21 +455,12 @@ class KeyListener(BaseManager):
 
         :param method: Method being unbound
         """
-        for (
-            name,
-            is_concurrent,
-            event_type,
-        ), listener_set in self._class_listeners.items():
-            listener_set = list(
-                filter(
-                    lambda call_list: method is not call_list[0],
-                    listener_set,
-                )
-            )
-            self._class_listeners.update(
-                {(name, is_concurrent, event_type): listener_set}
-            )
-        self._class_listener_binds.pop(method)
+        for hook_key in self._class_listener_binds.pop(method):
+            listener_set = self._class_listeners.get(hook_key, [])
+            # Modified in place, the dispatch index shares this list.
+            listener_set[:] = [
+                call_list for call_list in listener_set if call_list[0] is not method
+            ]
 
     def clear_bind(self, bind_name: str, eliminate_bind: bool = False) -> None:
         """
@@ -402,7 +479,12 @@ class KeyListener(BaseManager):
             # dictionary and shouldn't be absent
             # If this errors, it suggests another process is deleting the key first,
             # which could be causing other issues.
-            self._key_hooks.pop(key)
+            for func in self._key_hooks.pop(key):
+                hook_keys = self._func_binds.get(func, [])
+                if key in hook_keys:
+                    hook_keys.remove(key)
+                if not hook_keys:
+                    self._func_binds.pop(func, None)
 
         # Repeat for class listeners
         to_delete = []
@@ -410,33 +492,34 @@ class KeyListener(BaseManager):
             if name == bind_name:
                 to_delete.append((name, is_concurrent, event_type))
         for key in to_delete:
-            self._class_listeners.pop(key)
+            for method, _ in self._class_listeners.pop(key):
+                hook_keys = self._class_listener_binds.get(method, [])
+                if key in hook_keys:
+                    hook_keys.remove(key)
+
+        # Repeat for the dispatch index
+        dispatch_keys = [key for key in self._dispatch.keys() if key[0] == bind_name]
+        for dispatch_key in dispatch_keys:
+            self._dispatch.pop(dispatch_key)
+        self._active_event_types = {event_type for _, event_type in self._dispatch}
 
         if eliminate_bind:
             self.key_map.remove_bind(bind_name)
             self.joy_map.remove_bind(bind_name)
 
-    def _validate_input(self, key_bind: KeyBind, event: pygame.Event) -> bool:
+    def _validate_input(self, key_bind: KeyBind, mod_keys: int | None) -> bool:
         """
         Validates the input data against a key bind to ensure a match
 
         :param key_bind: Target key bind containing desired input data
-        :param input_data: Data coming from the recent input event
+        :param mod_keys: Mod keys of the recent input event, if any
         :return: True if the input data matches the bind, otherwise false
         """
-        is_valid = False
-        # This structure is here to potentially leave room for
-        key_changed: int | None = getattr(event, "key", None)
-        mod_keys: int | None = getattr(event, "mod", None)
-        if key_changed is not None:
-            mod = key_bind.mod
-            if mod is None:
-                is_valid = True
-            elif mod_keys is not None and (mod & mod_keys or mod is mod_keys):
-                # mod is mod_keys catches pygame.KMOD_NONE
-                is_valid = True
-
-        return is_valid
+        mod = key_bind.mod
+        # mod is mod_keys catches pygame.KMOD_NONE
+        return mod is None or (
+            mod_keys is not None and (mod is mod_keys or bool(mod & mod_keys))
+        )
 
     def _get_callables(self, event: pygame.Event) -> _CallableSets:
         """
@@ -444,38 +527,41 @@ class KeyListener(BaseManager):
 
         :param event: pygame event to be passed to the callables
         """
-        key_changed: int | None = getattr(event, "key", None)
+        # Event attribute access is comparatively slow, so only do it once.
+        event_type: int = event.type
+        if event_type not in self._active_event_types:
+            return _EMPTY_SETS
 
         binds: list[str] = []
-        if key_changed is not None:
-            binds = [
-                key_bind.bind_name
-                for key_bind in self.key_map.key_binds.get(key_changed, [])
-                if self._validate_input(key_bind, event)
-            ]
-        else:
-            if event.type == pygame.JOYBUTTONDOWN:
-                print(event.button)
+        if event_type in _JOY_EVENTS:
             binds = self.joy_map.get(event, [])
-        conc_funcs_lists = []
-        seq_funcs_lists = []
-        conc_methods_lists = []
-        seq_methods_lists = []
+        else:
+            key_changed: int | None = getattr(event, "key", None)
+            if key_changed is not None:
+                mod_keys: int | None = getattr(event, "mod", None)
+                # Most binds accept any mod keys, so skip validating those.
+                binds = [
+                    key_bind.bind_name
+                    for key_bind in self.key_map.key_binds.get(key_changed, [])
+                    if key_bind.mod is None or self._validate_input(key_bind, mod_keys)
+                ]
+        conc_funcs: list[Callable] = []
+        seq_funcs: list[Callable] = []
+        conc_methods: list[tuple[Callable, Type[object]]] = []
+        seq_methods: list[tuple[Callable, Type[object]]] = []
         for bind in binds:
-            conc_funcs_lists.append(self._key_hooks.get((bind, True, event.type), []))
-            seq_funcs_lists.append(self._key_hooks.get((bind, False, event.type), []))
-
-            conc_methods_lists.append(
-                self._class_listeners.get((bind, True, event.type), [])
-            )
-            seq_methods_lists.append(
-                self._class_listeners.get((bind, False, event.type), [])
-            )
+            hook_lists = self._dispatch.get((bind, event_type))
+            if hook_lists is None:
+                continue
+            conc_funcs.extend(hook_lists[0])
+            seq_funcs.extend(hook_lists[1])
+            conc_methods.extend(hook_lists[2])
+            seq_methods.extend(hook_lists[3])
         return _CallableSets(
-            concurrent_functions=list(itertools.chain(*conc_funcs_lists)),
-            sequential_functions=list(itertools.chain(*seq_funcs_lists)),
-            concurrent_methods=list(itertools.chain(*conc_methods_lists)),
-            sequential_methods=list(itertools.chain(*seq_methods_lists)),
+            concurrent_functions=conc_funcs,
+            sequential_functions=seq_funcs,
+            concurrent_methods=conc_methods,
+            sequential_methods=seq_methods,
         )
 
     @classmethod
@@ -534,10 +620,22 @@ def notifyKeyListeners(event: pygame.Event) -> None:
 
     :param event: Pygame event instance, of type KEYDOWN or KEYUP
     """
-    for listener in KeyListener._listeners.values():
+    for listener in KeyListener._listeners_cached:
         listener.notify(event)
 
 
+def notifyKeyListenersBatch(events: Iterable[pygame.Event]) -> None:
+    """
+    Automatically passes each event to all existing KeyListeners, in order
+
+    :param events: Iterable of pygame event instances, such as from pygame.event.get()
+    """
+    listeners = KeyListener._listeners_cached
+    for event in events:
+        for listener in listeners:
+            listener.notify(event)
+
+
 def getKeyListener(handle: str) -> KeyListener:
     """
     Supplies a Key Listener with the given handle. If one exists with that handle,
@@ -545,4 +643,9 @@ def getKeyListener(handle: str) -> KeyListener:
 
     :param handle: String describing the KeyListener.
     """
-    return KeyListener._listeners.setdefault(handle, KeyListener(handle))
+    listener = KeyListener._listeners.get(handle)
+    if listener is None:
+        listener = KeyListener(handle)
+        KeyListener._listeners[handle] = listener
+        KeyListener._listeners_cached = tuple(KeyListener._listeners.values())
+    return listener
@@ -145,10 +145,10 @@ class KeyMap:
         """
         packed_dict: dict[str, tuple[str | None, int | None]] = {}
         for key_code, bind_list in self.key_binds.items():
+            key_name = None
+            if key_code:
+                key_name = pygame.key.name(key_code)
             for bind in bind_list:
-                key_name = None
-                if key_code:
-                    key_name = pygame.key.name(key_code)
-                packed_dict.update({bind.bind_name: (key_name, bind.mod)})
+                packed_dict[bind.bind_name] = (key_name, bind.mod)
 
         return packed_dict
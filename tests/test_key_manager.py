@@ -5,6 +5,7 @@ import sys
 import threading
 from typing import Callable, cast
 import unittest
+from unittest import mock
 
 import pygame
 
@@ -13,6 +14,7 @@ sys.path.append(str(pathlib.Path.cwd()))
 from src.simple_events.key_manager import (  # noqa: E402
     getKeyListener,
     KeyListener,
+    notifyKeyListenersBatch,
 )
 
 from src.simple_events.key_map import (  # noqa: E402
@@ -24,6 +26,7 @@ from src.simple_events.joy_map import (  # noqa: E402
     JoyMap,
 )
 
+from src.simple_events import file_parser  # noqa: E402
 from src.simple_events.file_parser import (  # noqa: E402
     _get_parser_from_path,
     JSONParser,
@@ -153,6 +156,7 @@ class TestJoyMap(unittest.TestCase):
 
     def tearDown(self):
         self.joymap._joy_binds.clear()
+        self.joymap._bind_to_key.clear()
 
     def test_convert_event(self):
         joystick_data = {"button": 0}
@@ -188,6 +192,18 @@ class TestJoyMap(unittest.TestCase):
 
         self.assertEqual(converted_data, match_data)
 
+    def test_convert_event_unhashable(self):
+        # Ignored params may hold unhashable values
+        self.joymap.generate_bind("hat_bind", {"hat": 0, "value": [0, 1]})
+
+        self.assertIn("hat_bind", self.joymap._joy_binds.get((("hat", 0),), []))
+
+        event = pygame.Event(
+            pygame.JOYHATMOTION, hat=0, value=[0, 1], joy=0, instance_id=0
+        )
+
+        self.assertEqual(self.joymap.get(event), ["hat_bind"])
+
     def test_convert_pairs(self):
         key_data = (("button", 0),)
         converted_data = self.joymap._convert_pairs(key_data)
@@ -225,6 +241,16 @@ class TestJoyMap(unittest.TestCase):
 
         self.assertEqual(returned_data, joystick_data)
 
+    def test_init_binds(self):
+        match_data = (("button", 0),)
+        joymap = JoyMap({match_data: ["test_bind"], None: ["test_bind2"]})
+
+        self.assertEqual(joymap.get_bound_joystick_event("test_bind"), {"button": 0})
+        self.assertIsNone(joymap.get_bound_joystick_event("test_bind2"))
+        self.assertRaises(
+            ValueError, joymap.get_bound_joystick_event, "unbound_name"
+        )
+
     def test_remove_bind(self):
         bind_name = "test_bind"
         joystick_data = {"button": 0}
@@ -237,6 +263,10 @@ class TestJoyMap(unittest.TestCase):
         self.joymap.remove_bind(bind_name)
 
         self.assertNotIn(bind_name, self.joymap._joy_binds.get(match_data, []))
+        self.assertNotIn(match_data, self.joymap._joy_binds)
+        self.assertRaises(
+            ValueError, self.joymap.get_bound_joystick_event, bind_name
+        )
 
     def test_rebind(self):
         bind_name = "test_bind"
@@ -285,6 +315,22 @@ class TestJoyMap(unittest.TestCase):
         self.assertNotIn(bind_name2, self.joymap._joy_binds.get(match_data1, []))
         self.assertIn(bind_name2, self.joymap._joy_binds.get(new_match_data, []))
 
+    def test_merge_unchanged(self):
+        self.joymap.generate_bind("test_bind", {"button": 0})
+        self.joymap.generate_bind("test_bind2", {"button": 0})
+        self.joymap.generate_bind("test_bind3", None)
+
+        other_map = JoyMap()
+        other_map.generate_bind("test_bind2", {"button": 0})
+        other_map.generate_bind("test_bind3", None)
+
+        self.joymap.merge(other_map)
+
+        self.assertEqual(
+            self.joymap._joy_binds,
+            {(("button", 0),): ["test_bind", "test_bind2"], None: ["test_bind3"]},
+        )
+
     def test_pack_binds(self):
         bind_name = "test_bind"
         joystick_data = {"button": 0}
@@ -339,6 +385,24 @@ class TestJSONParser(unittest.TestCase):
 
         self.assertDictEqual(unpacked, comp_dict)
 
+    def test_unpack_joystick(self) -> None:
+
+        joymap = JoyMap()
+
+        joymap.generate_bind("bind0", {"button": 0})
+        joymap.generate_bind("bind1", {"button": 0})
+        joymap.generate_bind("bind2", {"hat": 1})
+
+        # Simulate the JSON round trip turning tuples into lists
+        packed = {
+            bind: [list(data_point) for data_point in joy_data]
+            for bind, joy_data in joymap.pack_binds().items()
+        }
+
+        unpacked = JSONParser._unpack_joystick(packed)
+
+        self.assertDictEqual(unpacked, joymap._joy_binds)
+
     def test_save(self) -> None:
 
         keymap = KeyMap()
@@ -362,6 +426,23 @@ class TestJSONParser(unittest.TestCase):
 
         self.assertEqual(out_string, json_string)
 
+    def test_save_non_ascii(self) -> None:
+
+        keymap = KeyMap()
+        joymap = JoyMap()
+
+        keymap.generate_bind("прыжок", pygame.K_0)
+
+        outfile = StringIO()
+
+        JSONParser.save(keymap, joymap, outfile)
+
+        out_string = outfile.getvalue()
+
+        # Escaped output can be written regardless of the locale's encoding
+        self.assertTrue(out_string.isascii())
+        self.assertEqual(json.loads(out_string)["keys"], {"прыжок": ["0", None]})
+
     def test_load(self) -> None:
 
         keymap = KeyMap()
@@ -387,6 +468,24 @@ class TestJSONParser(unittest.TestCase):
         for key in new_map.key_binds:
             self.assertEqual(new_map.key_binds.get(key), keymap.key_binds.get(key))
 
+    def test_load_without_orjson(self) -> None:
+
+        keymap = KeyMap()
+        joymap = JoyMap()
+
+        keymap.generate_bind("bind0", pygame.K_0)
+        joymap.generate_bind("bind1", {"button": 0})
+
+        infile = StringIO()
+        JSONParser.save(keymap, joymap, infile)
+        infile.seek(0)
+
+        with mock.patch.object(file_parser, "_loads", json.loads):
+            new_keymap, new_joymap = JSONParser.load(infile)
+
+        self.assertDictEqual(new_keymap.key_binds, keymap.key_binds)
+        self.assertDictEqual(new_joymap._joy_binds, joymap._joy_binds)
+
 
 class TestKeyListener(unittest.TestCase):
 
@@ -407,11 +506,16 @@ class TestKeyListener(unittest.TestCase):
 
     def tearDown(self) -> None:
         self.key_listener.key_map.key_binds.clear()
+        self.key_listener.joy_map._joy_binds.clear()
+        self.key_listener.joy_map._bind_to_key.clear()
         self.key_listener._key_hooks.clear()
+        self.key_listener._func_binds.clear()
         self.key_listener._assigned_classes.clear()
         self.key_listener._class_listener_binds.clear()
         self.key_listener._class_listeners.clear()
         self.key_listener._class_listener_instances.clear()
+        self.key_listener._dispatch.clear()
+        self.key_listener._active_event_types.clear()
 
     def test_sequential_tag(self) -> None:
 
@@ -541,6 +645,91 @@ class TestKeyListener(unittest.TestCase):
         )
         self.assertIn(test_func, bind2_list)
 
+    def test_bind_joystick(self) -> None:
+
+        def test_func(_) -> None:
+            pass
+
+        self.key_listener.bind("test_joy_bind0", {"button": 0})(test_func)
+        self.key_listener.bind(
+            "test_joy_bind1", default_joystick_data={"axis": 1}
+        )(test_func)
+        self.key_listener.bind("test_joy_bind2", {"hat": 0})(test_func)
+
+        self.assertIn(
+            ("test_joy_bind0", True, pygame.JOYBUTTONDOWN),
+            self.key_listener._key_hooks,
+        )
+        self.assertIn(
+            ("test_joy_bind1", True, pygame.JOYAXISMOTION),
+            self.key_listener._key_hooks,
+        )
+        self.assertIn(
+            ("test_joy_bind2", True, pygame.JOYHATMOTION),
+            self.key_listener._key_hooks,
+        )
+
+        callables = self.key_listener._get_callables(
+            pygame.Event(
+                pygame.JOYAXISMOTION, axis=1, instance_id=0, joy=0, value=0.5
+            )
+        )
+
+        self.assertIn(test_func, callables.concurrent_functions)
+
+    def test_rebind(self) -> None:
+
+        def test_func(_) -> None:
+            pass
+
+        self.key_listener.bind("test_bind0", pygame.K_0, pygame.KMOD_ALT)(test_func)
+        self.key_listener.bind("test_rebind_joy", {"button": 0})(test_func)
+
+        old_bind = self.key_listener.rebind("test_bind0", pygame.K_1, pygame.KMOD_CTRL)
+        self.assertEqual(old_bind, (pygame.K_0, pygame.KMOD_ALT))
+        self.assertEqual(
+            self.key_listener.key_map.get_bound_key("test_bind0"),
+            (pygame.K_1, pygame.KMOD_CTRL),
+        )
+
+        self.key_listener.rebind("test_bind0", new_key=pygame.K_2)
+        self.assertEqual(
+            self.key_listener.key_map.get_bound_key("test_bind0"), (pygame.K_2, None)
+        )
+
+        old_joy = self.key_listener.rebind("test_rebind_joy", {"button": 1})
+        self.assertEqual(old_joy, {"button": 0})
+
+        old_joy = self.key_listener.rebind(
+            "test_rebind_joy", new_joystick_data={"button": 2}
+        )
+        self.assertEqual(old_joy, {"button": 1})
+        self.assertEqual(
+            self.key_listener.joy_map.get_bound_joystick_event("test_rebind_joy"),
+            {"button": 2},
+        )
+
+    def test_get_callables_inactive_event(self) -> None:
+
+        def test_func(_) -> None:
+            pass
+
+        self.key_listener.bind("test_bind0", pygame.K_0)(test_func)
+
+        self.assertIn(pygame.KEYDOWN, self.key_listener._active_event_types)
+        self.assertNotIn(pygame.KEYUP, self.key_listener._active_event_types)
+
+        callables = self.key_listener._get_callables(
+            pygame.Event(pygame.KEYUP, key=pygame.K_0, mod=pygame.KMOD_NONE)
+        )
+
+        self.assertFalse(callables.concurrent_functions)
+        self.assertFalse(callables.sequential_functions)
+
+        self.key_listener.clear_bind("test_bind0")
+
+        self.assertNotIn(pygame.KEYDOWN, self.key_listener._active_event_types)
+
     def test_unbind(self) -> None:
 
         def test_func(_) -> None:
@@ -578,6 +767,12 @@ class TestKeyListener(unittest.TestCase):
             cast(list[Callable], bind2_list),
         )
 
+        self.key_listener.unbind(test_func)
+
+        self.assertNotIn(test_func, bind1_list)
+        self.assertNotIn(test_func, bind2_list)
+        self.assertNotIn(test_func, self.key_listener._func_binds)
+
     def test_clear_bind(self) -> None:
 
         def test_func(_) -> None:
@@ -610,6 +805,11 @@ class TestKeyListener(unittest.TestCase):
             cast(list[Callable], bind1_list),
         )
 
+        callables = self.key_listener._get_callables(
+            pygame.Event(pygame.KEYDOWN, key=pygame.K_0, mod=pygame.KMOD_ALT)
+        )
+        self.assertFalse(callables.concurrent_functions)
+
         self.key_listener.clear_bind("test_bind0", True)
 
         bind0_list = self.key_listener._key_hooks.get(
@@ -835,6 +1035,25 @@ class TestKeyListener(unittest.TestCase):
         for item in test_class_list:
             self.assertTrue(item.test_var)
 
+    def test_notify_batch(self) -> None:
+
+        called_keys: list[int] = []
+
+        @self.key_listener.sequential
+        def test_func(event) -> None:
+            called_keys.append(event.key)
+
+        self.key_listener.bind("test_bind0", pygame.K_0)(test_func)
+        self.key_listener.bind("test_bind1", pygame.K_1)(test_func)
+
+        events = [
+            pygame.event.Event(pygame.KEYDOWN, key=key, mod=pygame.KMOD_NONE)
+            for key in (pygame.K_1, pygame.K_2, pygame.K_0)
+        ]
+        notifyKeyListenersBatch(events)
+
+        self.assertEqual(called_keys, [pygame.K_1, pygame.K_0])
+
     def test_notify_sequential(self) -> None:
 
         example_var = False